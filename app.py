@@ -15,24 +15,139 @@ python -m streamlit run app/app.py
 ```
 
 The application creates a subdirectory under ``./cases/<case_id>/`` for
-each run, storing outputs and uploaded attachments.
+each case, storing uploaded attachments and, in one subdirectory per
+distinct set of inputs, the outputs.
 """
 
+import concurrent.futures
+import hashlib
+import math
 import os
+import pathlib
+import shutil
+import time
 from datetime import date
-import json
 
+import numpy as np
+import orjson
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
 
 from main import run_case
 
-
-def main():
+# The page config only needs to be sent once per session, not on every rerun.
+if "_page_configured" not in st.session_state:
     st.set_page_config(page_title="Forensic Economic Loss Calculator", layout="centered")
-    st.title("Forensic Economic Loss Calculator")
+    st.session_state["_page_configured"] = True
+
+# Manifests of previously processed cases, keyed by a hash of the inputs.
+CACHE_DIR = os.path.join("cases", ".cache")
+# Bump when the shape of the run_case result changes to retire old manifests.
+CACHE_VERSION = b"3"
+
+
+def _cfg_json(cfg: dict) -> bytes:
+    """Serialise a case configuration canonically (sorted keys)."""
+    return orjson.dumps(cfg, option=orjson.OPT_SORT_KEYS)
+
+
+def _case_key(cfg_json: bytes) -> str:
+    """Return a SHA-256 key identifying a serialised case configuration."""
+    return hashlib.sha256(CACHE_VERSION + cfg_json).hexdigest()
+
+
+def _output_dir(cfg_json: bytes, key: str) -> str:
+    """Return the directory holding the outputs for one case configuration.
+
+    Outputs live under ``cases/<case_id>/<key>/`` so that submitting the
+    same Case ID with different inputs never overwrites the files a
+    cached result points to.
+    """
+    return os.path.join("cases", orjson.loads(cfg_json)["case_id"], key)
+
+
+def _outputs_exist(result: dict) -> bool:
+    """Return whether every output file listed in ``result`` still exists."""
+    return all(os.path.exists(path) for path in result["files"].values())
+
+
+def _load_manifest(key: str):
+    """Return the cached result for ``key`` if its output files still exist."""
+    manifest_path = os.path.join(CACHE_DIR, f"{key}.json")
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, "rb") as f:
+        result = orjson.loads(f.read())
+    if not _outputs_exist(result):
+        return None
+    return result
+
+
+@st.cache_resource
+def _pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the process-wide worker pool shared by all sessions."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+# Seconds between checks on a running case.
+POLL_INTERVAL = 0.25
 
+
+def _process_case(key: str, cfg_json: bytes, status) -> dict:
+    """Run a case, reusing the outputs of an identical earlier submission.
+
+    Cases run on the shared worker pool while the script thread polls
+    for completion, refreshing ``status`` (an ``st.status`` container)
+    each time.  Those refreshes give Streamlit the chance to stop the
+    script when the user presses Stop or submits again.  The on-disk
+    manifest under ``cases/.cache/`` records finished cases, so repeat
+    submissions and server restarts skip the computation.
+    """
+    result = _load_manifest(key)
+    if result is None:
+        future = _pool().submit(run_case, orjson.loads(cfg_json), output_dir=_output_dir(cfg_json, key))
+        started = time.monotonic()
+        try:
+            while not future.done():
+                time.sleep(POLL_INTERVAL)
+                status.update(label=f"Processing case... ({time.monotonic() - started:.0f}s)")
+        finally:
+            # Drop the case if the script is stopped before a worker picks it up
+            future.cancel()
+        result = future.result()
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, f"{key}.json"), "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    return result
+
+
+def _pv_chart(pv_series: dict):
+    """Build the cumulative present value chart as a Vega-Lite spec.
+
+    The browser renders the chart, so no image is rasterised on the server.
+    """
+    # Imported here so the form paints without paying for these on first load
+    import altair as alt
+    import pandas as pd
+
+    return alt.Chart(pd.DataFrame(pv_series)).mark_line(point=True).encode(
+        x=alt.X("YearIndex:Q", title="Year Index"),
+        y=alt.Y("CumulativePV:Q", title="Cumulative PV (USD)"),
+    ).properties(height=300)
+
+
+@st.cache_data(show_spinner=False)
+def _file_bytes(path: str, mtime: float) -> bytes:
+    """Return the contents of an output file for a download button."""
+    return pathlib.Path(path).read_bytes()
+
+
+@st.fragment
+def _case_form():
+    """Render the case form and process a submitted case.
+
+    As a fragment, submitting the form reruns only this function; the
+    result is handed to ``_case_results`` through the session state.
+    """
     with st.form(key="case_form"):
         st.subheader("Case Identifier")
         case_id = st.text_input("Case ID", value="case_001")
@@ -62,6 +177,17 @@ def main():
         submit_button = st.form_submit_button(label="Run Case")
 
     if submit_button:
+        # Zero means "no override"; rates are entered as percentages
+        overrides = np.array([
+            life_expectancy_override,
+            worklife_override,
+            discount_rate_override / 100.0,
+            growth_rate_override / 100.0,
+        ], dtype=np.float64)
+        overrides = np.where(overrides > 0, overrides, np.nan).tolist()
+        life_override, wl_override, discount_override, growth_override = [
+            None if math.isnan(value) else value for value in overrides
+        ]
         # Build configuration dictionary
         cfg = {
             "case_id": case_id,
@@ -69,8 +195,8 @@ def main():
                 "first_name": first_name,
                 "last_name": last_name,
                 "sex": sex,
-                "dob": dob.strftime("%Y-%m-%d"),
-                "dod": dod.strftime("%Y-%m-%d"),
+                "dob": dob.isoformat(),
+                "dod": dod.isoformat(),
                 "education_level": education_level,
                 "active_status": active_status,
             },
@@ -83,58 +209,85 @@ def main():
             },
             "assumptions": {
                 "retirement_age_hint": retirement_age_hint,
-                "life_expectancy_override_years": life_expectancy_override if life_expectancy_override > 0 else None,
-                "worklife_table_override": worklife_override if worklife_override > 0 else None,
-                "discount_rate_override": (discount_rate_override / 100.0) if discount_rate_override > 0 else None,
-                "annual_growth_rate_override": (growth_rate_override / 100.0) if growth_rate_override > 0 else None,
+                "life_expectancy_override_years": life_override,
+                "worklife_table_override": wl_override,
+                "discount_rate_override": discount_override,
+                "annual_growth_rate_override": growth_override,
             },
             "attachments": {},
         }
         # Save attachments if provided
         if uploaded_file is not None:
-            case_dir = os.path.join("cases", case_id)
-            os.makedirs(case_dir, exist_ok=True)
-            attachment_path = os.path.join(case_dir, uploaded_file.name)
-            with open(attachment_path, "wb") as f:
-                f.write(uploaded_file.read())
-            cfg["attachments"]["slides"] = attachment_path
-        # Run calculation
-        with st.spinner("Processing case..."):
-            result = run_case(cfg)
-        st.success("Case processed successfully!")
-        # Display summary table
-        summary_df = pd.DataFrame([
-            {
-                "Life Expectancy (yrs)": result["summary"]["life_expectancy_years"],
-                "Worklife Remaining (yrs)": result["summary"]["worklife_remaining_years"],
-                "Avg Wage Growth (%)": result["summary"]["avg_wage_growth_pct"],
-                "Discount Rate (%)": result["summary"]["discount_rate_pct"],
-                "Total Economic Loss (USD)": result["summary"]["total_economic_loss_usd"],
-            }
-        ])
-        st.subheader("Summary")
-        st.table(summary_df.style.format({
-            "Life Expectancy (yrs)": "{:.2f}",
-            "Worklife Remaining (yrs)": "{:.2f}",
-            "Avg Wage Growth (%)": "{:.2f}",
-            "Discount Rate (%)": "{:.2f}",
-            "Total Economic Loss (USD)": "${:,.2f}",
-        }))
-        # Load PV series for chart
-        pv_file = result["files"]["excel_path"]
-        pv_df = pd.read_excel(pv_file, sheet_name="present_value")
-        st.subheader("Present Value over Time")
-        fig, ax = plt.subplots()
-        ax.plot(pv_df["YearIndex"], pv_df["CumulativePV"], marker='o')
-        ax.set_xlabel("Year Index")
-        ax.set_ylabel("Cumulative PV (USD)")
-        ax.grid(True)
-        st.pyplot(fig)
-        # Download buttons
-        with open(result["files"]["excel_path"], "rb") as f:
-            st.download_button("Download Excel", data=f, file_name=os.path.basename(result["files"]["excel_path"]))
-        with open(result["files"]["memo_pdf_path"], "rb") as f:
-            st.download_button("Download Memo (PDF)", data=f, file_name=os.path.basename(result["files"]["memo_pdf_path"]))
+            # Name the copy by content hash so unchanged uploads are written once
+            digest = hashlib.sha256(uploaded_file.getbuffer()).hexdigest()
+            case_dir = pathlib.Path("cases") / case_id
+            case_dir.mkdir(parents=True, exist_ok=True)
+            attachment_path = case_dir / f"{digest}_{uploaded_file.name}"
+            if not attachment_path.exists():
+                uploaded_file.seek(0)
+                with attachment_path.open("wb") as f:
+                    shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
+            cfg["attachments"]["slides"] = str(attachment_path)
+        # Run calculation, skipping it when identical inputs were seen before.
+        # The attachment path embeds its content hash, so cfg alone is the key.
+        cfg_json = _cfg_json(cfg)
+        key = _case_key(cfg_json)
+        with st.status("Processing case...") as status:
+            result = _process_case(key, cfg_json, status)
+            status.update(label="Case processed", state="complete", expanded=False)
+        st.session_state["result"] = result
+        # Repaint the full page so the results fragment shows the new case
+        st.rerun()
+
+
+@st.fragment
+def _case_results():
+    """Render the summary, chart and downloads for the last processed case.
+
+    As a fragment, clicking a download button reruns only this function.
+    """
+    result = st.session_state.get("result")
+    if result is None:
+        return
+    st.success("Case processed successfully!")
+    # Display summary table
+    summary = result["summary"]
+    st.subheader("Summary")
+    st.dataframe({
+        "Metric": [
+            "Life Expectancy (yrs)",
+            "Worklife Remaining (yrs)",
+            "Avg Wage Growth (%)",
+            "Discount Rate (%)",
+            "Total Economic Loss (USD)",
+        ],
+        "Value": [
+            f"{summary['life_expectancy_years']:.2f}",
+            f"{summary['worklife_remaining_years']:.2f}",
+            f"{summary['avg_wage_growth_pct']:.2f}",
+            f"{summary['discount_rate_pct']:.2f}",
+            f"${summary['total_economic_loss_usd']:,.2f}",
+        ],
+    }, hide_index=True)
+    # Chart the PV series returned by run_case
+    st.subheader("Present Value over Time")
+    st.altair_chart(_pv_chart(result["present_value"]))
+    # Download buttons
+    if not _outputs_exist(result):
+        st.warning("The output files for this case are no longer available. Run the case again to recreate them.")
+        return
+    excel_path = result["files"]["excel_path"]
+    st.download_button("Download Excel", data=_file_bytes(excel_path, os.path.getmtime(excel_path)),
+                       file_name=os.path.basename(excel_path))
+    memo_path = result["files"]["memo_pdf_path"]
+    st.download_button("Download Memo (PDF)", data=_file_bytes(memo_path, os.path.getmtime(memo_path)),
+                       file_name=os.path.basename(memo_path))
+
+
+def main():
+    st.title("Forensic Economic Loss Calculator")
+    _case_form()
+    _case_results()
 
 
 if __name__ == "__main__":
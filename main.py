@@ -59,6 +59,8 @@ subdirectory under ``./cases/<case_id>/`` containing:
   It cites the sources used in the calculations.
 * ``summary.json`` – a JSON file containing the high‑level results
   returned by ``run_case``.
+* ``.hash`` – a hash of the configuration that produced
+  ``summary.json``, used to skip recomputing an unchanged case.
 
 In addition to generating these files, ``run_case`` returns a
 dictionary with the summary information, file paths and an audit log.
@@ -76,54 +78,186 @@ print(results["summary"])  # prints the computed life expectancy, worklife, etc.
 
 """
 
+import functools
+import hashlib
 import json
 import math
 import os
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Tuple
+from dataclasses import MISSING, dataclass, fields
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
+import numpy as np
+import orjson
+
+# pandas and openpyxl are imported inside the functions that use them so
+# that importing this module (e.g., when the web app starts) stays cheap.
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+###############################################################################
+# Case configuration
+###############################################################################
+
+def _build_section(cls, data: Dict, section: str):
+    """Instantiate one configuration dataclass from its dictionary.
+
+    Fields without a default are required; unknown keys are ignored.
+    """
+    for f in fields(cls):
+        if f.default is MISSING and f.name not in data:
+            raise ValueError(f"Missing required {section} field: {f.name}")
+    return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+@dataclass(frozen=True)
+class Person:
+    """Details of the decedent."""
+    first_name: str
+    last_name: str
+    sex: str
+    dob: str
+    dod: str
+    education_level: str = "Other"
+    active_status: str = "active"
+
+
+@dataclass(frozen=True)
+class Occupation:
+    """Occupation and earnings of the decedent at the time of death."""
+    soc_code: str
+    title: str
+    county: str
+    state: str
+    base_salary_usd: float
+
+
+@dataclass(frozen=True)
+class Assumptions:
+    """Calculation assumptions; ``None`` overrides fall back to defaults."""
+    retirement_age_hint: float = 65
+    life_expectancy_override_years: Optional[float] = None
+    worklife_table_override: Optional[float] = None
+    discount_rate_override: Optional[float] = None
+    annual_growth_rate_override: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class CaseConfig:
+    """A validated case configuration as accepted by ``run_case``."""
+    case_id: str
+    person: Person
+    occupation: Occupation
+    assumptions: Assumptions
+    attachments: Dict[str, str]
+
+    @classmethod
+    def from_dict(cls, config: Dict) -> "CaseConfig":
+        """Validate a configuration dictionary and build a ``CaseConfig``.
+
+        Raises
+        ------
+        ValueError
+            If a required field is missing.
+        """
+        if "case_id" not in config:
+            raise ValueError("Missing required case field: case_id")
+        return cls(
+            case_id=config["case_id"],
+            person=_build_section(Person, config.get("person", {}), "person"),
+            occupation=_build_section(Occupation, config.get("occupation", {}), "occupation"),
+            assumptions=_build_section(Assumptions, config.get("assumptions") or {}, "assumptions"),
+            attachments=dict(config.get("attachments") or {}),
+        )
 
 
 ###############################################################################
 # Utility functions
 ###############################################################################
 
-def _load_life_table() -> pd.DataFrame:
+# Oldest age representable in the life table lookup.
+_MAX_AGE = 120
+
+
+@functools.lru_cache(maxsize=1)
+def _load_life_table() -> np.ndarray:
     """Load the 2023 life table for the total population from a local Excel
     file.  If the file is not present, raise an exception.
 
+    The table is parsed once per process and cached; the returned array
+    is read-only so callers cannot alter the cached values.
+
     Returns
     -------
-    DataFrame
-        A DataFrame with an ``Age`` column and an ``ex`` column giving
-        the expectation of life at age ``x``.
+    ndarray
+        The expectation of life indexed by integer age, so that
+        ``ex_by_age[45]`` is ``ex`` for the interval 45–46.  Ages not
+        covered by the table (e.g., the open-ended final interval) are NaN.
     """
     table_path = os.path.join(os.path.dirname(__file__), "Table01.xlsx")
     if not os.path.exists(table_path):
         raise FileNotFoundError(
             "Life table file not found. Please ensure Table01.xlsx is in the same directory."
         )
-    df = pd.read_excel(table_path)
+    rows = _read_life_table_rows(table_path)
+    ages: List[int] = []
+    ex_values: List[float] = []
     # The first column contains the age interval; the last column contains ex.
-    df = df.rename(
-        columns={
-            df.columns[0]: "Age",
-            df.columns[-1]: "ex",
-        }
-    )
-    # Drop any footnotes or summary rows.
-    df = df[df["Age"].astype(str).str.contains("–|-")]
-    # Convert age string (e.g., '45–46' or '45-46') to integer part 45.
-    df["age_int"] = df["Age"].str.split("–|-", regex=True).str[0].astype(int)
-    # Keep only necessary columns.
-    return df[["age_int", "ex"]].reset_index(drop=True)
+    for row in rows:
+        age = row[0]
+        # Skip any footnotes or summary rows.
+        if not isinstance(age, str):
+            continue
+        # Convert age string (e.g., '45–46' or '45-46') to integer part 45.
+        start, separator, _ = age.replace("–", "-").partition("-")
+        if not separator:
+            continue
+        ages.append(int(start))
+        ex_values.append(float(row[-1]))
+    ex_by_age = np.full(_MAX_AGE + 1, np.nan)
+    ex_by_age[np.array(ages, dtype=np.int32)] = ex_values
+    ex_by_age.flags.writeable = False
+    return ex_by_age
+
+
+def _read_life_table_rows(table_path: str) -> List[tuple]:
+    """Return the data rows (below the header) of the life table workbook.
+
+    The Rust-based ``python-calamine`` reader is used when it is
+    installed; otherwise the rows are streamed with openpyxl in
+    read-only mode.
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(table_path, read_only=True, data_only=True)
+        try:
+            return list(wb.active.iter_rows(min_row=2, values_only=True))
+        finally:
+            wb.close()
+    sheet = CalamineWorkbook.from_path(table_path).get_sheet_by_index(0)
+    return sheet.to_python(skip_empty_area=False)[1:]
+
+
+def _year_fractions(years: float) -> np.ndarray:
+    """Split a span of years into a per-year timeline.
+
+    Each whole year contributes 1.0 and any remaining fractional part is
+    appended as a final, partial year.
+    """
+    whole_years = int(math.floor(years))
+    fractional = years - whole_years
+    if fractional > 1e-6:
+        return np.append(np.ones(whole_years), fractional)
+    return np.ones(whole_years)
 
 
-def _compute_life_expectancy(age: float, sex: str, override_years: Optional[float] = None) -> Tuple[float, List[float]]:
+def _compute_life_expectancy(age: float, sex: str, override_years: Optional[float] = None) -> Tuple[float, np.ndarray]:
     """Compute remaining life expectancy and annual survival fractions.
 
     Parameters
@@ -143,8 +277,8 @@ def _compute_life_expectancy(age: float, sex: str, override_years: Optional[floa
     Returns
     -------
     (life_expectancy, survival_fractions)
-        A tuple containing the expected number of remaining years and a list
-        of fractional years for each year of the projection horizon.  The
+        A tuple containing the expected number of remaining years and an
+        array of fractional years for each year of the projection horizon.  The
         last element may be less than 1 if there is a fractional
         remainder.
     """
@@ -152,32 +286,26 @@ def _compute_life_expectancy(age: float, sex: str, override_years: Optional[floa
     if override_years is not None:
         life_expectancy = override_years
     else:
-        table = _load_life_table()
+        ex_by_age = _load_life_table()
         age_floor = int(math.floor(age))
         # Get expectation of life at the floor age.  If age beyond table, use 0.
-        ex_row = table[table["age_int"] == age_floor]
-        if ex_row.empty:
+        ex = ex_by_age[age_floor] if 0 <= age_floor <= _MAX_AGE else math.nan
+        if math.isnan(ex):
             life_expectancy = max(0.0, 78.4 - age)  # simple fallback【704230909144120†L1554-L1568】
         else:
-            life_expectancy = float(ex_row["ex"].values[0])
+            life_expectancy = float(ex)
             # Linear adjust within the year based on fractional part.
             # Use next year's expectation if available.
             frac = age - age_floor
-            next_row = table[table["age_int"] == age_floor + 1]
-            if not next_row.empty:
-                next_ex = float(next_row["ex"].values[0])
+            next_ex = float(ex_by_age[age_floor + 1]) if age_floor < _MAX_AGE else math.nan
+            if not math.isnan(next_ex):
                 # assume linear decrease between ages
                 life_expectancy -= frac * (life_expectancy - next_ex)
     # Build survival fractions: 1 for each whole year, plus remaining fractional part.
-    whole_years = int(math.floor(life_expectancy))
-    fractional = life_expectancy - whole_years
-    fractions = [1.0] * whole_years
-    if fractional > 1e-6:
-        fractions.append(fractional)
-    return life_expectancy, fractions
+    return life_expectancy, _year_fractions(life_expectancy)
 
 
-def _compute_worklife_expectancy(age: float, retirement_age_hint: float, active_status: str, education_level: str, override: Optional[float] = None) -> Tuple[float, List[float]]:
+def _compute_worklife_expectancy(age: float, retirement_age_hint: float, active_status: str, education_level: str, override: Optional[float] = None) -> Tuple[float, np.ndarray]:
     """Estimate remaining work‑life expectancy using a simplified model.
 
     This function follows the instructions to select a worklife table
@@ -206,22 +334,17 @@ def _compute_worklife_expectancy(age: float, retirement_age_hint: float, active_
     Returns
     -------
     (worklife_years, worklife_fractions)
-        A tuple containing the expected years of work remaining and a list
-        of fraction of year each year of the projection horizon.
+        A tuple containing the expected years of work remaining and an
+        array of the fraction of each year of the projection horizon.
     """
     if override is not None:
         wle = override
     else:
         wle = max(0.0, retirement_age_hint - age)
-    whole_years = int(math.floor(wle))
-    fractional = wle - whole_years
-    portions = [1.0] * whole_years
-    if fractional > 1e-6:
-        portions.append(fractional)
-    return wle, portions
+    return wle, _year_fractions(wle)
 
 
-def _compute_wage_growth_series(base_salary: float, growth_rate: float, years: int = 7) -> Tuple[pd.DataFrame, float]:
+def _compute_wage_growth_series(base_salary: float, growth_rate: float, years: int = 7) -> Tuple["pd.DataFrame", float]:
     """Construct a synthetic historical wage series and compute the average growth.
 
     Given a base salary (at the time of death), this function
@@ -246,34 +369,30 @@ def _compute_wage_growth_series(base_salary: float, growth_rate: float, years: i
         A DataFrame with columns ``Year``, ``MeanWage`` and
         ``YoYGrowth``, and the arithmetic average of the growth rates.
     """
-    # Most recent year is t=0 (the year of death).  We build backwards.
-    wages = []
-    yoy_rates = []
-    # Start with the base salary at t=0
-    current_salary = base_salary
-    for i in range(years):
-        year_index = years - 1 - i  # e.g., 0 for oldest year
-        wages.insert(0, current_salary)
-        current_salary /= (1 + growth_rate)
+    import pandas as pd
+
+    # Most recent year is t=0 (the year of death).  Earlier years are the
+    # base salary deflated by the growth rate, ordered oldest first.
+    wages = base_salary * (1 + growth_rate) ** -np.arange(years - 1, -1, -1, dtype=np.float64)
     # Compute yoy growth rates
-    for i in range(1, len(wages)):
-        prev = wages[i - 1]
-        cur = wages[i]
-        yoy = (cur - prev) / prev if prev else 0.0
-        yoy_rates.append(yoy)
-    avg_growth = sum(yoy_rates) / len(yoy_rates) if yoy_rates else 0.0
-    years_list = list(range(len(wages)))
+    prev = wages[:-1]
+    yoy_rates = np.divide(np.diff(wages), prev, out=np.zeros_like(prev), where=prev != 0)
+    avg_growth = float(yoy_rates.mean()) if yoy_rates.size else 0.0
     df = pd.DataFrame({
-        "YearIndex": years_list,
+        "YearIndex": np.arange(len(wages)),
         "MeanWage": wages,
     })
     # Align growth rates (first year has NaN growth)
-    df["YoYGrowth"] = [None] + yoy_rates
+    df["YoYGrowth"] = np.concatenate(([np.nan], yoy_rates))
     return df, avg_growth
 
 
-def _compute_projections(base_salary: float, growth_rate: float, portions: List[float]) -> Tuple[pd.DataFrame, List[float]]:
-    """Compute full year values, actual values and years timeline for projections.
+def _compute_pv_timeline(base_salary: float, growth_rate: float, portions: np.ndarray, discount_rate: float) -> "pd.DataFrame":
+    """Compute projected earnings, discount factors and present values.
+
+    Growth, the portion of each year worked, discounting and the running
+    total are evaluated together as whole-array operations over the
+    projection horizon.
 
     Parameters
     ----------
@@ -281,104 +400,54 @@ def _compute_projections(base_salary: float, growth_rate: float, portions: List[
         Salary at the start of the projection (first year after death).
     growth_rate : float
         Year‑over‑year growth rate.
-    portions : list of float
+    portions : ndarray
         Fraction of each year the decedent would have worked (from the
         worklife timeline).  Length defines the horizon.
-
-    Returns
-    -------
-    (df, full_year_values)
-        A DataFrame with columns ``YearIndex``, ``FullYearValue``,
-        ``PortionOfYear`` and ``ActualValue``.  ``FullYearValue`` is the
-        salary the decedent would have earned if working the entire
-        year.  ``ActualValue`` incorporates the fraction of the year
-        worked.
-    """
-    full_year_values = []
-    actual_values = []
-    current = base_salary
-    for i, portion in enumerate(portions):
-        current *= (1 + growth_rate) if i > 0 else 1.0
-        full_year_values.append(current)
-        actual_values.append(current * portion)
-    df = pd.DataFrame({
-        "YearIndex": list(range(len(portions))),
-        "FullYearValue": full_year_values,
-        "PortionOfYear": portions,
-        "ActualValue": actual_values,
-    })
-    return df, full_year_values
-
-
-def _compute_discount_factors(discount_rate: float, n: int) -> pd.DataFrame:
-    """Compute discount factors for each year t.
-
-    Parameters
-    ----------
     discount_rate : float
         The nominal annual discount rate (e.g., 0.037 for 3.7%).
-    n : int
-        Number of years for which to compute factors.
 
     Returns
     -------
     DataFrame
-        Columns ``YearIndex`` and ``DiscountFactor`` where
+        Columns ``YearIndex``, ``FullYearValue``, ``PortionOfYear``,
+        ``ActualValue``, ``DiscountFactor``, ``PresentValue`` and
+        ``CumulativePV``.  ``FullYearValue`` is the salary the decedent
+        would have earned if working the entire year; ``ActualValue``
+        incorporates the fraction of the year worked, and
         ``DiscountFactor[t] = 1 / (1 + discount_rate)**t``.
     """
-    factors = [1.0 / ((1 + discount_rate) ** t) for t in range(n)]
-    df = pd.DataFrame({
-        "YearIndex": list(range(n)),
-        "DiscountFactor": factors,
-    })
-    return df
-
-
-def _compute_present_values(actual_values: List[float], discount_factors: List[float]) -> pd.DataFrame:
-    """Compute present values and cumulative present values.
-
-    Parameters
-    ----------
-    actual_values : list of float
-        Actual earnings per year (already incorporating portion of year).
-    discount_factors : list of float
-        Discount factors aligned with the same years.
-
-    Returns
-    -------
-    DataFrame
-        Columns ``YearIndex``, ``PresentValue`` and ``CumulativePV``.
-    """
-    pv = []
-    cumulative = []
-    cum = 0.0
-    for i in range(len(actual_values)):
-        present = actual_values[i] * discount_factors[i]
-        pv.append(present)
-        cum += present
-        cumulative.append(cum)
-    df = pd.DataFrame({
-        "YearIndex": list(range(len(actual_values))),
-        "PresentValue": pv,
-        "CumulativePV": cumulative,
+    import pandas as pd
+
+    t = np.arange(len(portions), dtype=np.float64)
+    full_year_values = base_salary * (1.0 + growth_rate) ** t
+    actual_values = full_year_values * portions
+    discount_factors = (1.0 + discount_rate) ** -t
+    present_values = actual_values * discount_factors
+    return pd.DataFrame({
+        "YearIndex": np.arange(len(portions)),
+        "FullYearValue": full_year_values,
+        "PortionOfYear": portions,
+        "ActualValue": actual_values,
+        "DiscountFactor": discount_factors,
+        "PresentValue": present_values,
+        "CumulativePV": np.cumsum(present_values),
     })
-    return df
 
 
-def _create_excel_report(case_id: str, inputs: Dict, life_df: pd.DataFrame, worklife_df: pd.DataFrame, wage_df: pd.DataFrame,
-                         projections_df: pd.DataFrame, discount_df: pd.DataFrame, pv_df: pd.DataFrame,
-                         total_loss: float, discount_rate: float, avg_growth_rate: float, audit_log: List[str],
-                         output_path: str) -> str:
+def _create_excel_report(case: CaseConfig, life_df: "pd.DataFrame", worklife_df: "pd.DataFrame", wage_df: "pd.DataFrame",
+                         projections_df: "pd.DataFrame", discount_df: "pd.DataFrame", pv_df: "pd.DataFrame",
+                         life_expectancy: float, worklife_years: float, total_loss: float, discount_rate: float,
+                         avg_growth_rate: float, audit_log: List[str], output_path: str) -> str:
     """Assemble the Excel workbook with specified worksheets.
 
     Parameters
     ----------
-    case_id : str
-        Identifier for the case.
-    inputs : dict
-        Original input configuration used for the case.
+    case : CaseConfig
+        Validated configuration of the case.
     life_df, worklife_df, wage_df, projections_df, discount_df, pv_df : DataFrame
         DataFrames for each intermediate calculation.
+    life_expectancy, worklife_years : float
+        Remaining life and worklife expectancy shown on the dashboard.
     total_loss : float
         Final cumulative present value (total economic loss).
     audit_log : list of str
@@ -391,23 +460,25 @@ def _create_excel_report(case_id: str, inputs: Dict, life_df: pd.DataFrame, work
     str
         The file path of the created Excel workbook.
     """
+    import pandas as pd
+
     file_path = os.path.join(output_path, "forensic_loss.xlsx")
-    with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
+    with pd.ExcelWriter(file_path, engine="xlsxwriter") as writer:
         # Dashboard sheet summarises inputs and final totals
         dashboard_data = {
-            "Case ID": [case_id],
-            "First Name": [inputs["person"]["first_name"]],
-            "Last Name": [inputs["person"]["last_name"]],
-            "Sex": [inputs["person"]["sex"]],
-            "DOB": [inputs["person"]["dob"]],
-            "DOD": [inputs["person"]["dod"]],
-            "Occupation": [inputs["occupation"]["title"]],
-            "SOC Code": [inputs["occupation"]["soc_code"]],
-            "County": [inputs["occupation"]["county"]],
-            "State": [inputs["occupation"]["state"]],
-            "Base Salary (USD)": [inputs["occupation"]["base_salary_usd"]],
-            "Life Expectancy (years)": [life_df["life_expectancy"].iloc[0]],
-            "Worklife Remaining (years)": [worklife_df["worklife_years"].iloc[0]],
+            "Case ID": [case.case_id],
+            "First Name": [case.person.first_name],
+            "Last Name": [case.person.last_name],
+            "Sex": [case.person.sex],
+            "DOB": [case.person.dob],
+            "DOD": [case.person.dod],
+            "Occupation": [case.occupation.title],
+            "SOC Code": [case.occupation.soc_code],
+            "County": [case.occupation.county],
+            "State": [case.occupation.state],
+            "Base Salary (USD)": [case.occupation.base_salary_usd],
+            "Life Expectancy (years)": [life_expectancy],
+            "Worklife Remaining (years)": [worklife_years],
             "Average Wage Growth (%)": [avg_growth_rate * 100],
             "Discount Rate (%)": [discount_rate * 100],
             "Total Economic Loss (USD)": [total_loss],
@@ -415,31 +486,51 @@ def _create_excel_report(case_id: str, inputs: Dict, life_df: pd.DataFrame, work
         dashboard_df = pd.DataFrame(dashboard_data)
         dashboard_df.to_excel(writer, sheet_name="dashboard", index=False)
 
+        # The remaining tables are written column by column straight to
+        # xlsxwriter, bypassing pandas' per-cell conversion.
         # Life expectancy sheet
-        life_df.to_excel(writer, sheet_name="life_expectancy", index=False)
+        _write_table(writer.book, "life_expectancy", life_df)
         # Worklife lookup sheet
-        worklife_df.to_excel(writer, sheet_name="worklife_lookup", index=False)
+        _write_table(writer.book, "worklife_lookup", worklife_df)
         # Wage growth sheet
-        wage_df.to_excel(writer, sheet_name="wage_growth", index=False)
+        _write_table(writer.book, "wage_growth", wage_df)
         # Projections sheet
-        projections_df.to_excel(writer, sheet_name="projections", index=False)
+        _write_table(writer.book, "projections", projections_df)
         # Discount factors sheet
-        discount_df.to_excel(writer, sheet_name="discount_factors", index=False)
+        _write_table(writer.book, "discount_factors", discount_df)
         # Present value sheet
-        pv_df.to_excel(writer, sheet_name="present_value", index=False)
+        _write_table(writer.book, "present_value", pv_df)
         # Audit log
-        audit_df = pd.DataFrame({"AuditLog": audit_log})
-        audit_df.to_excel(writer, sheet_name="audit_log", index=False)
+        _write_table(writer.book, "audit_log", {"AuditLog": audit_log})
     return file_path
 
 
-def _create_pdf_memo(summary: Dict[str, float], inputs: Dict, audit_sources: List[str], output_path: str) -> str:
+def _write_table(workbook, sheet_name: str, table) -> None:
+    """Write a table to a new xlsxwriter worksheet, one column at a time.
+
+    Parameters
+    ----------
+    workbook : xlsxwriter.Workbook
+        The workbook to add the sheet to.
+    sheet_name : str
+        Name of the new worksheet.
+    table : DataFrame or dict
+        Mapping of column name to values; the names form the header row.
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, list(table))
+    for col, name in enumerate(table):
+        values = np.asarray(table[name]).tolist()
+        # Leave missing values as empty cells, as DataFrame.to_excel does
+        worksheet.write_column(1, col, [None if v != v else v for v in values])
+
+
+def _create_pdf_memo(summary: Dict[str, float], case: CaseConfig, audit_sources: List[str], output_path: str) -> str:
     """Generate a short PDF memo describing the methodology and results.
 
-    Unlike the original implementation that relied on the ``fpdf`` library
-    (which may not be available in the execution environment), this
-    function uses Matplotlib to render the memo as a single figure and
-    save it into a PDF.  The memo explains the key assumptions
+    The memo is laid out as text with ``fpdf2`` when it is installed; in
+    environments where it is not available, Matplotlib is used to render
+    the memo as figures saved into a PDF.  The memo explains the key assumptions
     (e.g., life table approximations, worklife proxy, synthetic wage
     series) and cites the sources used in the calculations.  It is
     intentionally concise to suit courtroom presentation.
@@ -448,8 +539,8 @@ def _create_pdf_memo(summary: Dict[str, float], inputs: Dict, audit_sources: Lis
     ----------
     summary : dict
         Summary of the final calculation (life expectancy, worklife, growth rate, etc.).
-    inputs : dict
-        Original case configuration.
+    case : CaseConfig
+        Validated configuration of the case.
     audit_sources : list of str
         Source citations included in the memo.
     output_path : str
@@ -468,11 +559,11 @@ def _create_pdf_memo(summary: Dict[str, float], inputs: Dict, audit_sources: Lis
         "Forensic Economic Loss Analysis",
     ])
     paragraphs.append([
-        f"Case ID: {inputs['case_id']}",
-        f"Person: {inputs['person']['first_name']} {inputs['person']['last_name']}",
-        f"Sex: {inputs['person']['sex'].title()}, DOB: {inputs['person']['dob']}, DOD: {inputs['person']['dod']}",
-        f"Occupation: {inputs['occupation']['title']} (SOC {inputs['occupation']['soc_code']}), "
-        f"County: {inputs['occupation']['county']}, State: {inputs['occupation']['state']}"
+        f"Case ID: {case.case_id}",
+        f"Person: {case.person.first_name} {case.person.last_name}",
+        f"Sex: {case.person.sex.title()}, DOB: {case.person.dob}, DOD: {case.person.dod}",
+        f"Occupation: {case.occupation.title} (SOC {case.occupation.soc_code}), "
+        f"County: {case.occupation.county}, State: {case.occupation.state}"
     ])
     paragraphs.append([
         "Methodology",
@@ -483,7 +574,7 @@ def _create_pdf_memo(summary: Dict[str, float], inputs: Dict, audit_sources: Lis
         f"computed as {summary['life_expectancy_years']:.2f} years.",
         "Work‑Life Expectancy: Because the Skoog‑Ciecka‑Krueger (2019) tables were not accessible at run time, "
         "this analysis proxies the remaining worklife by subtracting the decedent's age from a retirement age "
-        f"hint of {inputs['assumptions']['retirement_age_hint']}.  This yields {summary['worklife_remaining_years']:.2f} years of expected "
+        f"hint of {case.assumptions.retirement_age_hint}.  This yields {summary['worklife_remaining_years']:.2f} years of expected "
         "future work.  If the user supplies a worklife override, that value is used instead.",
         "Wage Growth: The California Employment Development Department's Occupational Employment and Wage "
         "Statistics (OEWS) data were unavailable due to certificate limitations.  A synthetic seven‑year wage "
@@ -510,34 +601,85 @@ def _create_pdf_memo(summary: Dict[str, float], inputs: Dict, audit_sources: Lis
         "All assumptions and approximations are clearly stated; practitioners should update the "
         "inputs and references when more precise data become available.",
     ])
-    # Create a PDF via PdfPages
-    with PdfPages(pdf_path) as pdf:
-        fig, ax = plt.subplots(figsize=(8.27, 11.69))  # A4 portrait in inches
-        ax.axis('off')
-        y = 0.97  # Start near top of page
-        line_height = 0.025
-        for para in paragraphs:
-            for line in para:
-                ax.text(0.02, y, line, fontsize=10, va='top', ha='left', wrap=True)
-                y -= line_height
-                if y < 0.05:
-                    # New page when running out of space
-                    pdf.savefig(fig)
-                    plt.close(fig)
-                    fig, ax = plt.subplots(figsize=(8.27, 11.69))
-                    ax.axis('off')
-                    y = 0.97
-            y -= line_height  # Extra space between paragraphs
-        pdf.savefig(fig)
-        plt.close(fig)
+    try:
+        from fpdf import FPDF
+    except ImportError:
+        _render_memo_matplotlib(paragraphs, pdf_path)
+    else:
+        _render_memo_fpdf(FPDF, paragraphs, pdf_path)
     return pdf_path
 
 
+# Unicode font for the memo; the core PDF fonts only cover Latin-1, which
+# would mangle names such as "Nguyễn".
+_MEMO_FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts", "DejaVuSans.ttf")
+# The memo font has no glyphs for the brackets around source citations.
+_MEMO_SUBSTITUTIONS = str.maketrans({
+    "\u3010": "[",  # left black lenticular bracket
+    "\u3011": "]",  # right black lenticular bracket
+})
+
+
+def _render_memo_fpdf(fpdf_class, paragraphs: List[List[str]], pdf_path: str) -> None:
+    """Lay out the memo paragraphs as wrapped text with fpdf2."""
+    pdf = fpdf_class(format="A4")
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+    pdf.add_font("DejaVuSans", fname=_MEMO_FONT_PATH)
+    pdf.set_font("DejaVuSans", size=10)
+    for para in paragraphs:
+        for line in para:
+            pdf.multi_cell(0, 5, line.translate(_MEMO_SUBSTITUTIONS), align="L", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(5)  # Extra space between paragraphs
+    pdf.output(pdf_path)
+
+
+# Page geometry for the Matplotlib memo renderer: A4 portrait, 10 pt text
+# with Matplotlib's default 1.2 line spacing, between 3% and 95% of the
+# page height.
+_MEMO_PAGE_SIZE = (8.27, 11.69)  # inches
+_MEMO_LINES_PER_PAGE = int((0.97 - 0.05) * _MEMO_PAGE_SIZE[1] * 72 / (10 * 1.2))
+# Characters of 10pt monospace (0.6em advance) that fit across the page
+_MEMO_LINE_WIDTH = 95
+
+
+def _render_memo_matplotlib(paragraphs: List[List[str]], pdf_path: str) -> None:
+    """Render the memo paragraphs onto A4 Matplotlib figures saved as a PDF.
+
+    Lines are wrapped up front so the pages can be split by line count,
+    and each page is drawn as a single text block that Matplotlib does
+    not have to measure for wrapping.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    # Blank line between paragraphs
+    lines = [
+        wrapped
+        for para in paragraphs
+        for line in (*para, "")
+        for wrapped in (textwrap.wrap(line.translate(_MEMO_SUBSTITUTIONS), _MEMO_LINE_WIDTH) or [""])
+    ]
+    with PdfPages(pdf_path) as pdf:
+        for start in range(0, len(lines), _MEMO_LINES_PER_PAGE):
+            page = "\n".join(lines[start:start + _MEMO_LINES_PER_PAGE])
+            fig = plt.figure(figsize=_MEMO_PAGE_SIZE)
+            fig.text(0.02, 0.97, page, fontsize=10, va='top', ha='left', family='monospace')
+            pdf.savefig(fig)
+            plt.close(fig)
+
+
 ###############################################################################
 # Main orchestration function
 ###############################################################################
 
-def run_case(config: Dict) -> Dict:
+# Artifacts ``run_case`` can write to the case directory.
+_OUTPUTS = ("excel", "pdf", "json")
+# Bump when the shape of the run_case result changes to retire saved results.
+_RESULT_VERSION = 1
+
+
+def run_case(config: Dict, outputs: Iterable[str] = _OUTPUTS, output_dir: Optional[str] = None) -> Dict:
     """Process a single case configuration and produce outputs.
 
     This function coordinates the entire workflow as outlined in the
@@ -550,25 +692,51 @@ def run_case(config: Dict) -> Dict:
     ----------
     config : dict
         A dictionary following the schema provided in the specification.
+    outputs : iterable of str, optional
+        Which artifacts to write: any of ``"excel"``, ``"pdf"`` and
+        ``"json"`` (``summary.json``).  All three by default; pass an
+        empty tuple when only the returned summary is needed.  When
+        ``summary.json`` is written, a hash of the configuration is stored
+        next to it; re-running an identical configuration returns the
+        saved result without recomputing, provided its files still exist.
+    output_dir : str, optional
+        Directory the artifacts are written to.  Defaults to
+        ``cases/<case_id>``.
 
     Returns
     -------
     dict
-        A dictionary containing the case id, summary statistics,
-        file paths and an audit log.
+        A dictionary containing the case id, summary statistics, the
+        cumulative present value series, paths of the files written and
+        an audit log.
     """
+    import pandas as pd
+
+    outputs = set(outputs)
+    unknown = outputs.difference(_OUTPUTS)
+    if unknown:
+        raise ValueError(f"Unknown output(s): {', '.join(sorted(unknown))}")
     # Validate required fields
-    required_person_fields = ["first_name", "last_name", "sex", "dob", "dod"]
-    for field in required_person_fields:
-        if field not in config["person"]:
-            raise ValueError(f"Missing required person field: {field}")
-    required_occ_fields = ["soc_code", "title", "county", "state", "base_salary_usd"]
-    for field in required_occ_fields:
-        if field not in config["occupation"]:
-            raise ValueError(f"Missing required occupation field: {field}")
+    case = CaseConfig.from_dict(config)
+    case_dir = output_dir if output_dir is not None else os.path.join("cases", case.case_id)
+    # Reuse the previous result when this exact configuration was already run
+    config_hash = hashlib.sha256(
+        json.dumps([_RESULT_VERSION, config, sorted(outputs)], sort_keys=True, default=str).encode()
+    ).hexdigest()
+    hash_path = os.path.join(case_dir, ".hash")
+    summary_json_path = os.path.join(case_dir, "summary.json")
+    if "json" in outputs and os.path.exists(hash_path) and os.path.exists(summary_json_path):
+        with open(hash_path) as f:
+            previous_hash = f.read().strip()
+        if previous_hash == config_hash:
+            with open(summary_json_path, "rb") as f:
+                previous = orjson.loads(f.read())
+            if all(os.path.exists(path) for path in previous["files"].values()):
+                return previous
+    person, occupation, assumptions = case.person, case.occupation, case.assumptions
     # Parse dates and compute age
-    dob = datetime.strptime(config["person"]["dob"], "%Y-%m-%d")
-    dod = datetime.strptime(config["person"]["dod"], "%Y-%m-%d")
+    dob = datetime.fromisoformat(person.dob)
+    dod = datetime.fromisoformat(person.dod)
     age_days = (dod - dob).days
     age_years = age_days / 365.25
 
@@ -578,66 +746,47 @@ def run_case(config: Dict) -> Dict:
     # Additional sources can be appended as the pipeline uses more data.
 
     # Life expectancy
-    le_override = config.get("assumptions", {}).get("life_expectancy_override_years")
     life_expectancy, life_fractions = _compute_life_expectancy(
         age=age_years,
-        sex=config["person"]["sex"],
-        override_years=le_override,
+        sex=person.sex,
+        override_years=assumptions.life_expectancy_override_years,
     )
-    life_df = pd.DataFrame({
-        "life_expectancy": [life_expectancy],
-        "fractions": [life_fractions],
-    })
 
     # Worklife expectancy
-    wle_override = config.get("assumptions", {}).get("worklife_table_override")
     wle, worklife_portions = _compute_worklife_expectancy(
         age=age_years,
-        retirement_age_hint=config.get("assumptions", {}).get("retirement_age_hint", 65),
-        active_status=config["person"].get("active_status", "active"),
-        education_level=config["person"].get("education_level", "Other"),
-        override=wle_override,
+        retirement_age_hint=assumptions.retirement_age_hint,
+        active_status=person.active_status,
+        education_level=person.education_level,
+        override=assumptions.worklife_table_override,
     )
-    worklife_df = pd.DataFrame({
-        "worklife_years": [wle],
-        "portions": [worklife_portions],
-    })
 
     # Wage data and growth rate
-    wage_growth_override = config.get("assumptions", {}).get("annual_growth_rate_override")
+    wage_growth_override = assumptions.annual_growth_rate_override
     default_growth_rate = 0.028  # 2.8% as per example
     growth_rate = wage_growth_override if wage_growth_override is not None else default_growth_rate
     wage_df, avg_growth = _compute_wage_growth_series(
-        base_salary=config["occupation"]["base_salary_usd"],
+        base_salary=occupation.base_salary_usd,
         growth_rate=growth_rate,
         years=7,
     )
     wage_df["avg_growth"] = avg_growth
-    # Earnings projections (future)
-    projections_df, full_year_values = _compute_projections(
-        base_salary=config["occupation"]["base_salary_usd"],
+    # Earnings projections, discount factors and present values (future)
+    discount_override = assumptions.discount_rate_override
+    default_discount_rate = 0.037  # 3.7% from YCharts snapshot【932787715657389†L130-L137】
+    discount_rate = discount_override if discount_override is not None else default_discount_rate
+    timeline_df = _compute_pv_timeline(
+        base_salary=occupation.base_salary_usd,
         growth_rate=growth_rate,
         portions=worklife_portions,
+        discount_rate=discount_rate,
     )
-    # Discount factors
-    discount_override = config.get("assumptions", {}).get("discount_rate_override")
-    default_discount_rate = 0.037  # 3.7% from YCharts snapshot【932787715657389†L130-L137】
-    discount_rate = discount_override if discount_override is not None else default_discount_rate
-    discount_df = _compute_discount_factors(discount_rate, len(projections_df))
-    # Present values
-    pv_df = _compute_present_values(projections_df["ActualValue"].tolist(), discount_df["DiscountFactor"].tolist())
-    total_loss = pv_df["CumulativePV"].iloc[-1]
-
-    # Build life sheet details; expand fractions into a timeline DataFrame for clarity
-    life_timeline_df = pd.DataFrame({
-        "YearIndex": list(range(len(life_fractions))),
-        "LifeFraction": life_fractions,
-    })
-    # Build worklife detail DataFrame
-    worklife_timeline_df = pd.DataFrame({
-        "YearIndex": list(range(len(worklife_portions))),
-        "PortionOfYear": worklife_portions,
-    })
+    projections_df = timeline_df[["YearIndex", "FullYearValue", "PortionOfYear", "ActualValue"]]
+    discount_df = timeline_df[["YearIndex", "DiscountFactor"]]
+    pv_df = timeline_df[["YearIndex", "PresentValue", "CumulativePV"]]
+    # No remaining worklife means no loss (and an empty timeline)
+    total_loss = float(pv_df["CumulativePV"].iloc[-1]) if len(pv_df) else 0.0
+
     # Prepare summary dictionary
     summary = {
         "life_expectancy_years": life_expectancy,
@@ -646,59 +795,61 @@ def run_case(config: Dict) -> Dict:
         "discount_rate_pct": discount_rate * 100,
         "total_economic_loss_usd": total_loss,
     }
+    files: Dict[str, str] = {}
     # Create case directory
-    case_dir = os.path.join("cases", config["case_id"])
-    os.makedirs(case_dir, exist_ok=True)
-    # Write Excel workbook
-    excel_path = _create_excel_report(
-        case_id=config["case_id"],
-        inputs=config,
-        life_df=pd.concat([life_df, life_timeline_df], axis=1),
-        worklife_df=pd.concat([worklife_df, worklife_timeline_df], axis=1),
-        wage_df=wage_df,
-        projections_df=projections_df,
-        discount_df=discount_df,
-        pv_df=pv_df,
-        total_loss=total_loss,
-        discount_rate=discount_rate,
-        avg_growth_rate=avg_growth,
-        audit_log=audit_log,
-        output_path=case_dir,
-    )
-    # Write PDF memo
-    memo_path = _create_pdf_memo(
-        summary=summary,
-        inputs=config,
-        audit_sources=audit_log,
-        output_path=case_dir,
-    )
-    # Write summary JSON
-    summary_json_path = os.path.join(case_dir, "summary.json")
-    with open(summary_json_path, "w") as f:
-        json.dump({
-            "case_id": config["case_id"],
-            "summary": summary,
-            "files": {
-                "excel_path": excel_path,
-                "memo_pdf_path": memo_path,
-            },
-            "audit": {
-                "sources": audit_log,
-                "notes": [
-                    "Life expectancy approximated using total population table due to access limitations",
-                    "Worklife expectancy derived from retirement age hint",
-                    "Wage series synthesised using assumed growth rate",
-                ],
-            },
-        }, f, indent=2)
-    # Return result dictionary
-    return {
-        "case_id": config["case_id"],
+    if outputs:
+        os.makedirs(case_dir, exist_ok=True)
+        # The files below replace those of any saved result, so drop its
+        # hash first; it is only written again once summary.json is.
+        if os.path.exists(hash_path):
+            os.remove(hash_path)
+    if "excel" in outputs:
+        # Build life sheet details; expand fractions into a timeline DataFrame for clarity
+        life_df = pd.DataFrame({
+            "YearIndex": np.arange(len(life_fractions)),
+            "LifeFraction": life_fractions,
+            "life_expectancy": life_expectancy,
+        })
+        # Build worklife detail DataFrame
+        worklife_df = pd.DataFrame({
+            "YearIndex": np.arange(len(worklife_portions)),
+            "PortionOfYear": worklife_portions,
+            "worklife_years": wle,
+        })
+        # Write Excel workbook
+        files["excel_path"] = _create_excel_report(
+            case=case,
+            life_df=life_df,
+            worklife_df=worklife_df,
+            wage_df=wage_df,
+            projections_df=projections_df,
+            discount_df=discount_df,
+            pv_df=pv_df,
+            life_expectancy=life_expectancy,
+            worklife_years=wle,
+            total_loss=total_loss,
+            discount_rate=discount_rate,
+            avg_growth_rate=avg_growth,
+            audit_log=audit_log,
+            output_path=case_dir,
+        )
+    if "pdf" in outputs:
+        # Write PDF memo
+        files["memo_pdf_path"] = _create_pdf_memo(
+            summary=summary,
+            case=case,
+            audit_sources=audit_log,
+            output_path=case_dir,
+        )
+    # Result dictionary (also written to summary.json)
+    result = {
+        "case_id": case.case_id,
         "summary": summary,
-        "files": {
-            "excel_path": excel_path,
-            "memo_pdf_path": memo_path,
+        "present_value": {
+            "YearIndex": pv_df["YearIndex"].tolist(),
+            "CumulativePV": pv_df["CumulativePV"].tolist(),
         },
+        "files": files,
         "audit": {
             "sources": audit_log,
             "notes": [
@@ -708,3 +859,36 @@ def run_case(config: Dict) -> Dict:
             ],
         },
     }
+    if "json" in outputs:
+        # Write summary JSON, then record which configuration produced it
+        with open(summary_json_path, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        with open(hash_path, "w") as f:
+            f.write(config_hash)
+    return result
+
+
+def run_cases(configs: List[Dict], outputs: Iterable[str] = _OUTPUTS, max_workers: Optional[int] = None) -> List[Dict]:
+    """Process several case configurations in parallel.
+
+    Cases are independent of one another, so they are distributed over a
+    pool of worker processes.  Each worker parses the life table once and
+    reuses it for every case it handles.
+
+    Parameters
+    ----------
+    configs : list of dict
+        Case configurations, each following the schema accepted by
+        ``run_case``.
+    outputs : iterable of str, optional
+        Artifacts to write for each case, as for ``run_case``.
+    max_workers : int, optional
+        Number of worker processes.  Defaults to the number of CPUs.
+
+    Returns
+    -------
+    list of dict
+        The ``run_case`` results, in the same order as ``configs``.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(functools.partial(run_case, outputs=tuple(outputs)), configs))